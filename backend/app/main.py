@@ -2,12 +2,17 @@
 Drought Analytics Microservice - FastAPI Main Application
 """
 
-from fastapi import FastAPI, HTTPException, UploadFile, File
+from fastapi import FastAPI, HTTPException, UploadFile, File, BackgroundTasks, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from typing import Optional
-from datetime import datetime
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import orjson
+import asyncio
 import io
 import os
 import sys
@@ -17,8 +22,10 @@ load_dotenv()
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.services.ml_service import DroughtMLService
-from app.services.database_service import DatabaseService
+from app.services.ml_service import DroughtMLService, FEATURE_COLS, FEATURE_COUNT
+from app.services.database_service import DatabaseService, get_db_service
+from app.services.batching_service import BatchingPredictor
+from app.utils.helpers import utc_now_iso
 from app.models.prediction_model import (
     ManualPredictionRequest,
     PredictionResponse,
@@ -31,7 +38,8 @@ app = FastAPI(
     description="Cloud-deployed microservice with REST APIs for drought data ingestion, analytics, and LSTM-based forecasting",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # CORS Configuration
@@ -45,7 +53,24 @@ app.add_middleware(
 
 # Initialize services
 ml_service = DroughtMLService()
-db_service = DatabaseService()
+
+# Dedicated pool for blocking TensorFlow inference so it doesn't stall the event loop
+executor = ThreadPoolExecutor(max_workers=int(os.getenv("ML_WORKERS", "2")))
+
+# Coalesces concurrent single-window predictions into one batched model call
+batcher = BatchingPredictor(
+    ml_service,
+    executor,
+    max_batch=int(os.getenv("PREDICT_MAX_BATCH", "32")),
+    max_wait=float(os.getenv("PREDICT_MAX_WAIT_MS", "5")) / 1000,
+)
+
+# Windows per model call when streaming CSV predictions
+STREAM_CHUNK = int(os.getenv("STREAM_CHUNK", "256"))
+
+# Single writer thread for streamed-chunk saves: blocking boto3 writes stay off
+# the event loop and the inference pool, and chunks are persisted in order
+db_executor = ThreadPoolExecutor(max_workers=1)
 
 # Startup event
 @app.on_event("startup")
@@ -53,14 +78,19 @@ async def startup_event():
     """Initialize services on startup"""
     print("🚀 Starting Drought Analytics Microservice...")
     ml_service.load_model()
-    await db_service.connect()
+    await get_db_service().connect()
+    batcher.start()
     print("✅ Services initialized successfully")
 
 # Shutdown event
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown"""
-    await db_service.disconnect()
+    await batcher.stop()
+    await get_db_service().disconnect()
+    executor.shutdown(wait=False)
+    # Flush pending chunk saves without blocking the event loop while they drain
+    await asyncio.get_running_loop().run_in_executor(None, db_executor.shutdown)
     print("👋 Service shutdown complete")
 
 # Health check endpoint
@@ -70,7 +100,7 @@ async def health_check():
     return {
         "status": "healthy",
         "model_loaded": ml_service.model is not None,
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": utc_now_iso(),
         "version": "1.0.0"
     }
 
@@ -94,28 +124,37 @@ async def root():
 
 # Manual prediction endpoint
 @app.post("/predict/manual", response_model=PredictionResponse)
-async def predict_manual(request: ManualPredictionRequest):
+async def predict_manual(
+    request: ManualPredictionRequest,
+    background_tasks: BackgroundTasks,
+    db_service: DatabaseService = Depends(get_db_service)
+):
     """Single prediction from manual input (12 months of data)"""
     try:
-        # Convert Pydantic models to dict, then DataFrame
-        data_list = [item.dict() for item in request.data]
-        df = pd.DataFrame(data_list)
-        
-        print(f"📊 DataFrame shape: {df.shape}")
-        print(f"📋 Columns: {df.columns.tolist()}")
-        
         # Validate shape
-        if len(df) != 12:
+        if len(request.data) != 12:
             raise HTTPException(
                 status_code=400,
-                detail=f"Expected 12 months of data, got {len(df)}"
+                detail=f"Expected 12 months of data, got {len(request.data)}"
             )
+
+        # Straight from Pydantic to a (12, 19) array — no DataFrame on this path
+        arr = np.fromiter(
+            (getattr(item, f) for item in request.data for f in FEATURE_COLS),
+            dtype=np.float32,
+            count=12 * FEATURE_COUNT,
+        ).reshape(12, FEATURE_COUNT)
+        if np.isnan(arr).any():
+            raise HTTPException(status_code=400, detail="Input contains NaN values")
+        data_list = [item.dict() for item in request.data[:1]]  # DB keeps only the first month
+
+        # Make prediction (batched with any concurrent requests)
+        result = await batcher.submit(arr)
         
-        # Make prediction
-        result = ml_service.predict(df)
-        
-        # Save to database (will skip if no DB)
-        await db_service.save_prediction(
+        # Save to database after the response is sent (will skip if no DB);
+        # save_prediction is sync, so Starlette runs it in its threadpool
+        background_tasks.add_task(
+            db_service.save_prediction,
             prediction_type="manual",
             input_data=data_list,
             result=result,
@@ -124,30 +163,61 @@ async def predict_manual(request: ManualPredictionRequest):
         
         return result
         
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"❌ Prediction error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def _read_csv(contents: bytes) -> pa.Table:
+    """Parse uploaded CSV bytes, typing the model features as float32"""
+    return pacsv.read_csv(
+        io.BytesIO(contents),
+        convert_options=pacsv.ConvertOptions(
+            column_types={c: pa.float32() for c in FEATURE_COLS}
+        ),
+    )
+
+async def _stream_predictions(arr: np.ndarray, filename: str, db_service: DatabaseService):
+    """
+    Yield NDJSON predictions chunk by chunk, handing each chunk to the DB writer thread.
+    At most one chunk per stream is queued for writing: the next chunk waits for the
+    previous save, so a slow DynamoDB applies backpressure instead of piling up dicts.
+    """
+    loop = asyncio.get_running_loop()
+    pending = None
+    for start in range(0, max(0, len(arr) - 11), STREAM_CHUNK):
+        preds = await loop.run_in_executor(
+            executor, ml_service.predict_batch_array, arr[start:start + STREAM_CHUNK + 11], start
+        )
+        if pending is not None:
+            await asyncio.wrap_future(pending)
+        pending = db_executor.submit(db_service.save_batch_predictions, filename, preds)
+        yield b"".join(orjson.dumps(p) + b"\n" for p in preds)
+
 # CSV upload endpoint
 @app.post("/data")
-async def upload_data(file: UploadFile = File(...)):
-    """Upload CSV file for batch predictions"""
+async def upload_data(
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    stream: bool = False,
+    db_service: DatabaseService = Depends(get_db_service)
+):
+    """
+    Upload CSV file for batch predictions.
+    With ?stream=true the windows are returned as NDJSON while they are computed.
+    """
     try:
-        # Read CSV
+        # Parse CSV with Arrow off the event loop, straight from the raw bytes
         contents = await file.read()
-        df = pd.read_csv(io.StringIO(contents.decode('utf-8')))
+        loop = asyncio.get_running_loop()
+        table = await loop.run_in_executor(executor, _read_csv, contents)
         
-        print(f"📊 CSV shape: {df.shape}")
-        print(f"📋 Columns: {df.columns.tolist()}")
+        print(f"📊 CSV shape: ({table.num_rows}, {table.num_columns})")
+        print(f"📋 Columns: {table.column_names}")
         
         # Validate columns
-        required_columns = [
-    'EVI', 'LST', 'LST_Night', 'Rainfall', 'Soil_Moisture',
-    'SPI', 'PET', 'SPEI', 'NDVI_min', 'NDVI_max', 'VCI',
-    'LST_min', 'LST_max', 'TCI', 'SM_min', 'SM_max', 'SMCI', 'VHI', 'SIWSI'
-]
-        
-        missing_cols = set(required_columns) - set(df.columns)
+        missing_cols = set(FEATURE_COLS) - set(table.column_names)
         if missing_cols:
             raise HTTPException(
                 status_code=400,
@@ -155,20 +225,34 @@ async def upload_data(file: UploadFile = File(...)):
             )
         
         # Generate predictions for rolling windows
-        predictions = ml_service.predict_batch(df)
+        arr = np.column_stack([col.to_numpy() for col in table.select(FEATURE_COLS).columns])
+        if stream:
+            return StreamingResponse(
+                _stream_predictions(arr, file.filename, db_service),
+                media_type="application/x-ndjson"
+            )
+
+        predictions = await loop.run_in_executor(
+            executor, ml_service.predict_batch_array, arr
+        )
         
-        # Save to MongoDB (will skip if no DB)
-        await db_service.save_batch_predictions(
+        # Save to DynamoDB after the response is sent (will skip if no DB),
+        # in Starlette's threadpool since the boto3 batch write blocks
+        background_tasks.add_task(
+            db_service.save_batch_predictions,
             filename=file.filename,
             predictions=predictions
         )
         
-        return {
+        # Returned as a Response so the payload skips jsonable_encoder
+        return ORJSONResponse(content={
             "message": "Data processed successfully",
             "total_predictions": len(predictions),
             "predictions": predictions
-        }
+        })
         
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"❌ CSV processing error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -177,29 +261,32 @@ async def upload_data(file: UploadFile = File(...)):
 @app.get("/forecast")
 async def get_forecast(
     location: Optional[str] = None,
-    limit: int = 10
+    limit: int = 10,
+    db_service: DatabaseService = Depends(get_db_service)
 ):
     """Get recent drought forecasts"""
     try:
-        forecasts = await db_service.get_recent_predictions(
+        # DynamoDB reads block, so they run in the threadpool, not on the loop
+        forecasts = await run_in_threadpool(
+            db_service.get_recent_predictions,
             location=location,
             limit=limit
         )
         
-        return {
+        return ORJSONResponse(content={
             "total": len(forecasts),
             "forecasts": forecasts
-        }
+        })
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 # Summary endpoint
 @app.get("/summary")
-async def get_summary():
+async def get_summary(db_service: DatabaseService = Depends(get_db_service)):
     """Get system statistics and drought summary"""
     try:
-        summary = await db_service.get_summary_stats()
+        summary = await run_in_threadpool(db_service.get_summary_stats)
         return summary
         
     except Exception as e:
@@ -209,21 +296,23 @@ async def get_summary():
 @app.get("/history")
 async def get_history(
     skip: int = 0,
-    limit: int = 50
+    limit: int = 50,
+    db_service: DatabaseService = Depends(get_db_service)
 ):
     """Get prediction history with pagination"""
     try:
-        history = await db_service.get_prediction_history(
+        history = await run_in_threadpool(
+            db_service.get_prediction_history,
             skip=skip,
             limit=limit
         )
         
-        return {
+        return ORJSONResponse(content={
             "total": len(history),
             "skip": skip,
             "limit": limit,
             "history": history
-        }
+        })
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -235,7 +324,7 @@ async def http_exception_handler(request, exc):
         status_code=exc.status_code,
         content={
             "error": exc.detail,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": utc_now_iso()
         }
     )
 
@@ -245,5 +334,8 @@ if __name__ == "__main__":
         "main:app",
         host="0.0.0.0",
         port=int(os.getenv("PORT", 8000)),
-        reload=True
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count())),
+        log_level="warning"
     )
@@ -0,0 +1,88 @@
+"""
+Micro-batching for single-window predictions
+Concurrent /predict/manual requests are held for a few milliseconds and
+run through the LSTM as one (B, 12, 19) batch instead of B separate calls.
+"""
+
+import asyncio
+import numpy as np
+from concurrent.futures import Executor
+from typing import Dict
+
+
+class BatchingPredictor:
+    """Collects (12, 19) windows from concurrent callers and predicts them together"""
+
+    def __init__(self, ml_service, executor: Executor, max_batch: int = 32, max_wait: float = 0.005):
+        self.ml_service = ml_service
+        self.executor = executor
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue = None
+        self._task = None
+
+    def start(self):
+        """Start the batching loop — must be called from the running event loop"""
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the batching loop"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def submit(self, arr: np.ndarray) -> Dict:
+        """Queue one (12, 19) window and wait for its prediction"""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((arr, future))
+        return await future
+
+    async def _collect(self) -> list:
+        """Wait for one request, then gather more until max_batch or max_wait"""
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait
+
+        while len(batch) < self.max_batch:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+
+            try:
+                if len(batch) == 1:
+                    # Lone request: use the fixed-shape (1, 12, 19) single-window graph
+                    result = await loop.run_in_executor(
+                        self.executor, self.ml_service.predict_array, batch[0][0]
+                    )
+                    results = [result]
+                else:
+                    windows = np.stack([arr for arr, _ in batch])
+                    results = await loop.run_in_executor(
+                        self.executor, self.ml_service.predict_many, windows
+                    )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            # Callers that went away (cancelled futures) are simply skipped
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
@@ -4,11 +4,13 @@ Replaces MongoDB with AWS DynamoDB (ap-south-1)
 """
 
 import boto3
+from botocore.config import Config
 import json
 import uuid
-from datetime import datetime
+from app.utils.helpers import utc_now_iso
 from typing import Optional, List, Dict, Any
 from decimal import Decimal
+from functools import lru_cache
 import os
 
 
@@ -40,6 +42,15 @@ class DatabaseService:
     TABLE_NAME = "drought_predictions"
     REGION = os.getenv("AWS_REGION", "ap-south-1")
 
+    # Bounded connection pool and short timeouts so a slow/unreachable
+    # endpoint fails fast instead of piling up requests
+    CLIENT_CONFIG = Config(
+        max_pool_connections=int(os.getenv("DYNAMO_POOL", "20")),
+        connect_timeout=2,
+        read_timeout=10,
+        retries={"max_attempts": 3, "mode": "standard"},
+    )
+
     def __init__(self):
         self.dynamodb = None
         self.table = None
@@ -52,6 +63,7 @@ class DatabaseService:
                 region_name=self.REGION,
                 aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
                 aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
+                config=self.CLIENT_CONFIG,
             )
             await self._ensure_table()
             print(f"✅ Connected to DynamoDB table: {self.TABLE_NAME}")
@@ -84,14 +96,18 @@ class DatabaseService:
         """No persistent connection to close for DynamoDB"""
         pass
 
-    async def save_prediction(
+    def save_prediction(
         self,
         prediction_type: str,
         input_data: List[Dict],
         result: Dict,
         location: Optional[str] = None,
     ):
-        """Save a single prediction to DynamoDB"""
+        """
+        Save a single prediction to DynamoDB.
+        Plain (sync) def: boto3 blocks, so callers run it off the event loop —
+        Starlette runs sync background tasks in its threadpool.
+        """
         if not self.table:
             return
 
@@ -105,7 +121,7 @@ class DatabaseService:
                 "severity_level": result.get("severity_level", "unknown"),
                 "confidence_score": str(result.get("confidence_score", 0)),
                 "model_version": result.get("model_version", "1.0.0"),
-                "created_at": datetime.utcnow().isoformat(),
+                "created_at": utc_now_iso(),
                 "input_summary": json.dumps(float_to_decimal(input_data[:1])),  # store first month as sample
             }
 
@@ -113,15 +129,20 @@ class DatabaseService:
         except Exception as e:
             print(f"⚠️ Failed to save prediction: {e}")
 
-    async def save_batch_predictions(self, filename: str, predictions: List[Dict]):
-        """Save batch predictions from CSV upload"""
+    def save_batch_predictions(self, filename: str, predictions: List[Dict]):
+        """Save batch predictions from CSV upload — one item per window (sync, like save_prediction)"""
         if not self.table:
             return
 
         try:
+            created_at = utc_now_iso()
+
+            # batch_writer buffers into 25-item BatchWriteItem calls and
+            # resends unprocessed items, so this is a bulk insert; items are
+            # built one at a time inside it to avoid a second copy of the batch
             with self.table.batch_writer() as batch:
                 for pred in predictions:
-                    item = {
+                    batch.put_item(Item={
                         "id": str(uuid.uuid4()),
                         "prediction_type": "batch",
                         "location": filename,
@@ -130,17 +151,18 @@ class DatabaseService:
                         "severity_level": pred.get("severity_level", "unknown"),
                         "confidence_score": str(pred.get("confidence_score", 0)),
                         "model_version": pred.get("model_version", "1.0.0"),
-                        "created_at": datetime.utcnow().isoformat(),
+                        "window_start": pred.get("window_start", 0),
+                        "window_end": pred.get("window_end", 0),
+                        "created_at": created_at,
                         "input_summary": "{}",
-                    }
-                    batch.put_item(Item=item)
+                    })
         except Exception as e:
             print(f"⚠️ Failed to save batch predictions: {e}")
 
-    async def get_prediction_history(
+    def get_prediction_history(
         self, skip: int = 0, limit: int = 50
     ) -> List[Dict]:
-        """Get prediction history from DynamoDB"""
+        """Get prediction history from DynamoDB (sync — blocking scan, call off the event loop)"""
         if not self.table:
             return []
 
@@ -174,55 +196,50 @@ class DatabaseService:
             print(f"⚠️ Failed to get history: {e}")
             return []
 
-    async def get_recent_predictions(
+    def get_recent_predictions(
         self, location: Optional[str] = None, limit: int = 10
     ) -> List[Dict]:
         """Get recent predictions optionally filtered by location"""
-        history = await self.get_prediction_history(limit=100)
+        history = self.get_prediction_history(limit=100)
 
         if location:
             history = [h for h in history if h.get("location") == location]
 
         return history[:limit]
 
-    async def get_summary_stats(self) -> Dict[str, Any]:
-        """Calculate summary statistics from all predictions"""
+    def get_summary_stats(self) -> Dict[str, Any]:
+        """Calculate summary statistics from all predictions (sync — full paginated scan)"""
         if not self.table:
             return self._empty_summary()
 
         try:
-            response = self.table.scan()
-            items = response.get("Items", [])
-
-            while "LastEvaluatedKey" in response:
-                response = self.table.scan(
-                    ExclusiveStartKey=response["LastEvaluatedKey"]
-                )
-                items.extend(response.get("Items", []))
-
-            if not items:
-                return self._empty_summary()
-
-            items = [decimal_to_float(i) for i in items]
+            # Only pull the three attributes the summary needs, and fold each
+            # page into running aggregates instead of materializing every item
+            scan_kwargs = {"ProjectionExpression": "regcdi_value, drought_category, created_at"}
+            regcdi_values = []
+            dist = {}
+            last_date = ""
 
-            regcdi_values = [float(i.get("regcdi_value", 0)) for i in items]
-            avg_regcdi = sum(regcdi_values) / len(regcdi_values)
+            while True:
+                response = self.table.scan(**scan_kwargs)
+                for item in response.get("Items", []):
+                    regcdi_values.append(float(item.get("regcdi_value", 0)))
+                    cat = item.get("drought_category", "Unknown").lower().replace(" ", "_")
+                    dist[cat] = dist.get(cat, 0) + 1
+                    last_date = max(last_date, item.get("created_at", ""))
 
-            # Drought distribution
-            dist = {}
-            for item in items:
-                cat = item.get("drought_category", "Unknown").lower().replace(" ", "_")
-                dist[cat] = dist.get(cat, 0) + 1
+                if "LastEvaluatedKey" not in response:
+                    break
+                scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
 
-            last_date = max(
-                (i.get("created_at", "") for i in items), default="N/A"
-            )
+            if not regcdi_values:
+                return self._empty_summary()
 
             return {
-                "total_predictions": len(items),
-                "average_regcdi": round(avg_regcdi, 3),
+                "total_predictions": len(regcdi_values),
+                "average_regcdi": round(sum(regcdi_values) / len(regcdi_values), 3),
                 "drought_distribution": dist,
-                "last_prediction_date": last_date,
+                "last_prediction_date": last_date or "N/A",
                 "regcdi_values": regcdi_values,
             }
 
@@ -238,3 +255,12 @@ class DatabaseService:
             "last_prediction_date": "N/A",
             "regcdi_values": [],
         }
+
+
+@lru_cache(maxsize=1)
+def get_db_service() -> DatabaseService:
+    """
+    Process-wide DatabaseService, injected into routes with Depends(get_db_service)
+    so every caller shares one DynamoDB connection pool
+    """
+    return DatabaseService()
@@ -7,7 +7,8 @@ import os
 import numpy as np
 import pandas as pd
 import pickle
-from datetime import datetime
+import threading
+from app.utils.helpers import utc_now_iso
 from typing import List, Dict
 
 # EXACT feature order from training notebook Cell 7
@@ -24,8 +25,18 @@ NDVI_MIN = 1899.86
 NDVI_MAX = 7348.72
 NDVI_MEAN = 4590.97
 
+FEATURE_COUNT = len(FEATURE_COLS)
+
 MODEL_DIR = "/home/hamsi/drought-prediction-system/backend/ml_models"
 
+# TFLite intra-op threads per interpreter. Each of WEB_CONCURRENCY workers owns its
+# interpreters, so split the cores between workers instead of giving each all of them
+_CPUS = os.cpu_count() or 1
+TFLITE_THREADS = int(os.getenv(
+    "TFLITE_THREADS",
+    max(1, _CPUS // int(os.getenv("WEB_CONCURRENCY", _CPUS))),
+))
+
 def ndvi_to_drought(ndvi_value: float) -> tuple:
     """
     Map predicted NDVI (GEE pixel sum) to drought category.
@@ -54,15 +65,63 @@ def ndvi_to_regcdi(ndvi_value: float) -> float:
     Scaled so average NDVI = 0, extremes = ±2.
     """
     ndvi_norm = (ndvi_value - NDVI_MEAN) / (NDVI_MAX - NDVI_MIN)
-    return round(float(np.clip(ndvi_norm * 4, -2.0, 2.0)), 4)
+    return round(min(2.0, max(-2.0, ndvi_norm * 4)), 4)
+
+
+def ndvi_confidence(ndvi_value: float) -> float:
+    """
+    Confidence from how far normalized NDVI sits from the midpoint,
+    clamped to [0.55, 0.97]. Straight-line arithmetic, no temporaries.
+    """
+    ndvi_norm = (ndvi_value - NDVI_MIN) / (NDVI_MAX - NDVI_MIN)
+    return round(min(0.97, max(0.55, 0.70 + abs(ndvi_norm - 0.5) * 0.5)), 4)
+
+
+# Lookup tables indexed by drought level 0 (none) .. 4 (extreme)
+_CATEGORY_LABELS = ("No Drought", "Mild Drought", "Moderate Drought", "Severe Drought", "Extreme Drought")
+_SEVERITY_LEVELS = ("none", "mild", "moderate", "severe", "extreme")
+
+def ndvi_to_level_vec(ndvi_values: np.ndarray) -> np.ndarray:
+    """Vectorized ndvi_to_drought — drought level codes indexing _CATEGORY_LABELS"""
+    ndvi_norm = np.clip((ndvi_values - NDVI_MIN) / (NDVI_MAX - NDVI_MIN), 0.0, 1.0)
+    return np.select(
+        [ndvi_norm >= 0.65, ndvi_norm >= 0.45, ndvi_norm >= 0.30, ndvi_norm >= 0.15],
+        [0, 1, 2, 3],
+        default=4,
+    ).astype(np.uint8)
+
+
+def ndvi_to_regcdi_vec(ndvi_values: np.ndarray) -> np.ndarray:
+    """Vectorized ndvi_to_regcdi"""
+    ndvi_norm = (ndvi_values - NDVI_MEAN) / (NDVI_MAX - NDVI_MIN)
+    return np.round(np.clip(ndvi_norm * 4, -2.0, 2.0), 4)
+
+
+def ndvi_confidence_vec(ndvi_values: np.ndarray) -> np.ndarray:
+    """Vectorized ndvi_confidence"""
+    ndvi_norm = (ndvi_values - NDVI_MIN) / (NDVI_MAX - NDVI_MIN)
+    return np.round(np.clip(0.70 + np.abs(ndvi_norm - 0.5) * 0.5, 0.55, 0.97), 4)
+
+
+def feature_matrix(df: pd.DataFrame) -> np.ndarray:
+    """
+    (N, 19) float32 array in FEATURE_COLS order.
+    Stacks the columns directly instead of building a reordered DataFrame;
+    frames that are already in training order are converted as-is.
+    """
+    if df.columns.tolist() == FEATURE_COLS:
+        return df.to_numpy(dtype=np.float32)
+    return np.column_stack([df[c].to_numpy(dtype=np.float32) for c in FEATURE_COLS])
 
 
 class DroughtMLService:
     def __init__(self):
-        self.model = None
+        self.model = None  # Keras model, or the TFLite interpreter when serving TFLite
         self.scaler_X = None
         self.scaler_y = None
         self.model_version = "stat-LSTM-v1.0-vidarbha"
+        self._infer = None
+        self._infer_batch = None
 
     def load_model(self):
         """Load LSTM model and both scalers"""
@@ -70,25 +129,95 @@ class DroughtMLService:
             import tensorflow as tf
 
             model_path    = os.path.join(MODEL_DIR, "stat_lstm_best_model.h5")
+            tflite_path   = os.path.join(MODEL_DIR, "stat_lstm.tflite")
             scaler_x_path = os.path.join(MODEL_DIR, "scaler_X.pkl")
             scaler_y_path = os.path.join(MODEL_DIR, "scaler_y.pkl")
 
-            self.model = tf.keras.models.load_model(
-                model_path,
-                custom_objects={"mse": tf.keras.losses.MeanSquaredError()}
-            )
+            # Prefer the quantized TFLite export (see convert_tflite.py) when shipped
+            if os.path.exists(tflite_path):
+                self._load_tflite(tf, tflite_path)
+            else:
+                self._load_keras(tf, model_path)
 
             with open(scaler_x_path, "rb") as f:
                 self.scaler_X = pickle.load(f)
             with open(scaler_y_path, "rb") as f:
                 self.scaler_y = pickle.load(f)
 
+            # Fitted StandardScaler params as float32 so scaling is one broadcast op
+            self._mx = self.scaler_X.mean_.astype(np.float32)
+            self._sx = self.scaler_X.scale_.astype(np.float32)
+            self._my = self.scaler_y.mean_.astype(np.float32)
+            self._sy = self.scaler_y.scale_.astype(np.float32)
+
+            self._warm_up()
+
             print(f"✅ stat-LSTM loaded — {self.scaler_X.n_features_in_} features, target=NDVI")
 
         except Exception as e:
             print(f"❌ Model load failed: {e}")
             self.model = None
 
+    def _load_keras(self, tf, model_path: str):
+        """Load the FP32 Keras model behind traced forward passes"""
+        # Inference only — skip restoring the training config (loss, optimizer
+        # slots, metrics), which is also what needed the "mse" custom object
+        self.model = tf.keras.models.load_model(model_path, compile=False)
+
+        # Traced forward pass for the single-window case — skips the
+        # Model.predict dispatcher, and graph calls are safe across threads
+        model = self.model
+        infer = tf.function(
+            lambda x: model(x, training=False),
+            input_signature=[tf.TensorSpec((1, 12, FEATURE_COUNT), tf.float32)],
+        )
+        self._infer = lambda x: infer(x).numpy()
+
+        # Same forward pass over any number of stacked windows (CSV path)
+        infer_batch = tf.function(
+            lambda x: model(x, training=False),
+            input_signature=[tf.TensorSpec((None, 12, FEATURE_COUNT), tf.float32)],
+        )
+        self._infer_batch = lambda x: infer_batch(x).numpy()
+
+    def _load_tflite(self, tf, tflite_path: str):
+        """
+        Load the dynamic-range quantized TFLite model. The single-window path
+        keeps its own interpreter at (1, 12, 19) so it never has to re-allocate
+        after a batch call resized the input.
+        """
+        with open(tflite_path, "rb") as f:
+            tflite_bytes = f.read()
+
+        def make_runner():
+            interp = tf.lite.Interpreter(model_content=tflite_bytes, num_threads=TFLITE_THREADS)
+            interp.allocate_tensors()
+            inp  = interp.get_input_details()[0]["index"]
+            out  = interp.get_output_details()[0]["index"]
+            lock = threading.Lock()  # an Interpreter must not be invoked concurrently
+
+            def run(x: np.ndarray) -> np.ndarray:
+                with lock:
+                    if tuple(interp.get_input_details()[0]["shape"]) != x.shape:
+                        interp.resize_tensor_input(inp, x.shape)
+                        interp.allocate_tensors()
+                    interp.set_tensor(inp, x)
+                    interp.invoke()
+                    return interp.get_tensor(out).copy()
+            return interp, run
+
+        self.model, self._infer = make_runner()
+        _, self._infer_batch    = make_runner()
+        self.model_version += "-tflite"
+
+    def _warm_up(self):
+        """
+        Trace both forward passes with dummy input at startup so the first
+        /predict/manual and the first CSV upload don't pay graph construction.
+        """
+        self._infer(np.zeros((1, 12, FEATURE_COUNT), dtype=np.float32))
+        self._infer_batch(np.zeros((32, 12, FEATURE_COUNT), dtype=np.float32))
+
     def _df_from_request(self, data_list: List[Dict]) -> pd.DataFrame:
         """Convert API request dicts to correctly-ordered DataFrame"""
         df = pd.DataFrame(data_list)
@@ -99,45 +228,108 @@ class DroughtMLService:
 
     def predict(self, df: pd.DataFrame) -> Dict:
         """Run single 12-month prediction"""
+        return self.predict_array(feature_matrix(df))
+
+    def predict_array(self, arr: np.ndarray) -> Dict:
+        """Run single 12-month prediction on a (12, 19) array in FEATURE_COLS order"""
         if self.model is None:
             raise RuntimeError("Model not loaded")
 
-        X_scaled = self.scaler_X.transform(df[FEATURE_COLS].values)
-        X_seq    = X_scaled.reshape(1, 12, len(FEATURE_COLS))
+        X_scaled = (arr - self._mx) / self._sx
+        X_seq    = X_scaled[None, ...]
 
-        y_scaled = self.model.predict(X_seq, verbose=0)
-        ndvi_pred = float(self.scaler_y.inverse_transform(y_scaled)[0][0])
+        y_scaled  = self._infer(X_seq)
+        ndvi_pred = float(y_scaled[0, 0] * self._sy[0] + self._my[0])
 
-        category, severity = ndvi_to_drought(ndvi_pred)
-        regcdi             = ndvi_to_regcdi(ndvi_pred)
+        return self._build_result(ndvi_pred)
 
-        # Confidence: based on how far from category boundary
-        ndvi_norm  = (ndvi_pred - NDVI_MIN) / (NDVI_MAX - NDVI_MIN)
-        confidence = min(0.97, max(0.55, 0.70 + abs(ndvi_norm - 0.5) * 0.5))
+    def _build_result(self, ndvi_pred: float) -> Dict:
+        """Map a predicted NDVI value to the API response fields"""
+        category, severity = ndvi_to_drought(ndvi_pred)
 
         return {
-            "regcdi_value":     regcdi,
+            "regcdi_value":     ndvi_to_regcdi(ndvi_pred),
             "drought_category": category,
             "severity_level":   severity,
-            "confidence_score": round(confidence, 4),
+            "confidence_score": ndvi_confidence(ndvi_pred),
             "model_version":    self.model_version,
-            "prediction_date":  datetime.utcnow().isoformat(),
+            "prediction_date":  utc_now_iso(),
             "ndvi_predicted":   round(ndvi_pred, 2),
         }
 
     def predict_batch(self, df: pd.DataFrame) -> List[Dict]:
         """Sliding 12-month window predictions"""
+        return self.predict_batch_array(feature_matrix(df))
+
+    def predict_batch_array(self, arr: np.ndarray, window_offset: int = 0) -> List[Dict]:
+        """
+        Sliding 12-month window predictions over an (N, 19) array, in one batched model call.
+        window_offset shifts the reported window indices when arr is a slice of a larger upload.
+        """
+        if self.model is None:
+            raise RuntimeError("Model not loaded")
+        if len(arr) < 12:
+            return []
+
+        # Scale each of the N rows once (not 12x per overlapping window), then
+        # take a zero-copy (N-11, 12, 19) strided view of every rolling window;
+        # the only copy is the contiguous model input itself
+        scaled  = (arr - self._mx) / self._sx
+        windows = np.lib.stride_tricks.sliding_window_view(scaled, window_shape=12, axis=0)
+
+        # Blank CSV cells arrive as NaN; skip any window containing one, as the
+        # per-window loop did, instead of emitting NaN-derived categories
+        valid = ~np.isnan(windows).any(axis=(1, 2))
+        if not valid.all():
+            print(f"⚠️ {int((~valid).sum())} window(s) with missing values skipped")
+            if not valid.any():
+                return []
+        starts = np.flatnonzero(valid) + window_offset
+        X_seq  = np.ascontiguousarray(windows[valid].transpose(0, 2, 1))
+
+        return self._batch_results(self._run_batch(X_seq), starts)
+
+    def predict_many(self, windows: np.ndarray) -> List[Dict]:
+        """Independent 12-month predictions for a (B, 12, 19) stack of windows, in one model call"""
         if self.model is None:
             raise RuntimeError("Model not loaded")
 
+        X_seq = ((windows - self._mx) / self._sx).astype(np.float32)
+        return self._batch_results(self._run_batch(X_seq))
+
+    def _run_batch(self, X_seq: np.ndarray) -> np.ndarray:
+        """Scaled (B, 12, 19) input -> (B,) predicted NDVI"""
+        y_scaled = self._infer_batch(X_seq)
+        return (y_scaled[:, 0] * self._sy[0] + self._my[0]).astype(np.float64)
+
+    def _batch_results(self, ndvi_preds: np.ndarray, window_starts: np.ndarray = None) -> List[Dict]:
+        """
+        Vectorized _build_result: each field is computed once as a column, then
+        the API dicts are zipped from those columns in one pass. Category and
+        severity strings are shared from the label tables, not copied per row.
+        window_starts, when given, adds window_start/window_end to every result.
+        """
+        prediction_date = utc_now_iso()
+        columns = (
+            ndvi_to_regcdi_vec(ndvi_preds).tolist(),
+            ndvi_to_level_vec(ndvi_preds).tolist(),
+            ndvi_confidence_vec(ndvi_preds).tolist(),
+            np.round(ndvi_preds, 2).tolist(),
+        )
+        starts = window_starts.tolist() if window_starts is not None else [None] * len(ndvi_preds)
         results = []
-        for i in range(len(df) - 11):
-            window = df.iloc[i: i + 12]
-            try:
-                result = self.predict(window)
-                result["window_start"] = i
-                result["window_end"]   = i + 11
-                results.append(result)
-            except Exception as e:
-                print(f"⚠️ Window {i} skipped: {e}")
-        return results
\ No newline at end of file
+        for r, level, conf, ndvi, start in zip(*columns, starts):
+            result = {
+                "regcdi_value":     r,
+                "drought_category": _CATEGORY_LABELS[level],
+                "severity_level":   _SEVERITY_LEVELS[level],
+                "confidence_score": conf,
+                "model_version":    self.model_version,
+                "prediction_date":  prediction_date,
+                "ndvi_predicted":   ndvi,
+            }
+            if start is not None:
+                result["window_start"] = start
+                result["window_end"]   = start + 11
+            results.append(result)
+        return results
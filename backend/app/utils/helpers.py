@@ -0,0 +1,15 @@
+"""
+Shared helpers
+"""
+
+import time
+
+
+def utc_now_iso() -> str:
+    """
+    Current UTC time as 'YYYY-MM-DDTHH:MM:SS.ffffff' — the same string
+    datetime.utcnow().isoformat() produced, without building a datetime
+    (utcnow is deprecated as of Python 3.12).
+    """
+    t = time.time()
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(t)) + f".{int(t % 1 * 1e6):06d}"
@@ -0,0 +1,23 @@
+"""
+One-off export of the stat-LSTM to a dynamic-range quantized TFLite model.
+Run from backend/: python convert_tflite.py
+DroughtMLService serves ml_models/stat_lstm.tflite instead of the .h5 when it exists.
+"""
+
+import tensorflow as tf
+
+model = tf.keras.models.load_model("ml_models/stat_lstm_best_model.h5", compile=False)
+
+converter = tf.lite.TFLiteConverter.from_keras_model(model)
+converter.optimizations = [tf.lite.Optimize.DEFAULT]
+# Fall back to TF kernels for any op without a TFLite builtin
+converter.target_spec.supported_ops = [
+    tf.lite.OpsSet.TFLITE_BUILTINS,
+    tf.lite.OpsSet.SELECT_TF_OPS,
+]
+tflite_bytes = converter.convert()
+
+with open("ml_models/stat_lstm.tflite", "wb") as f:
+    f.write(tflite_bytes)
+
+print(f"Wrote ml_models/stat_lstm.tflite ({len(tflite_bytes) / 1024:.1f} KB)")
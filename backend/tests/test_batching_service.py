@@ -0,0 +1,135 @@
+"""
+Tests for the /predict/manual micro-batcher, driven against a stub ML service.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from app.services.batching_service import BatchingPredictor
+
+
+class StubMLService:
+    """Records which entry point each batch used; results echo the window's sum"""
+
+    def __init__(self, fail: Exception = None):
+        self.fail = fail
+        self.single_calls = 0
+        self.batch_sizes = []
+
+    def predict_array(self, arr):
+        self.single_calls += 1
+        if self.fail:
+            raise self.fail
+        return {"total": float(arr.sum())}
+
+    def predict_many(self, windows):
+        self.batch_sizes.append(len(windows))
+        if self.fail:
+            raise self.fail
+        return [{"total": float(w.sum())} for w in windows]
+
+
+def _window(value: float) -> np.ndarray:
+    return np.full((12, 19), value, dtype=np.float32)
+
+
+def _run(service, scenario, max_batch=32, max_wait=0.05):
+    """Run scenario(batcher) on a started batcher and always stop it afterwards"""
+    async def main():
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            batcher = BatchingPredictor(service, executor, max_batch=max_batch, max_wait=max_wait)
+            batcher.start()
+            try:
+                return await scenario(batcher)
+            finally:
+                await batcher.stop()
+    return asyncio.run(main())
+
+
+def test_lone_request_uses_single_window_path():
+    service = StubMLService()
+
+    result = _run(service, lambda b: b.submit(_window(1.0)))
+
+    assert result == {"total": 12 * 19 * 1.0}
+    assert service.single_calls == 1
+    assert service.batch_sizes == []
+
+
+def test_concurrent_requests_share_one_batch_and_get_their_own_result():
+    service = StubMLService()
+    values = [1.0, 2.0, 3.0, 4.0]
+
+    async def scenario(b):
+        return await asyncio.gather(*(b.submit(_window(v)) for v in values))
+
+    results = _run(service, scenario)
+
+    assert results == [{"total": 12 * 19 * v} for v in values]
+    assert service.batch_sizes == [len(values)]
+    assert service.single_calls == 0
+
+
+def test_batches_are_capped_at_max_batch():
+    service = StubMLService()
+
+    async def scenario(b):
+        return await asyncio.gather(*(b.submit(_window(float(v))) for v in range(5)))
+
+    results = _run(service, scenario, max_batch=2)
+
+    assert results == [{"total": 12 * 19 * float(v)} for v in range(5)]
+    assert sum(service.batch_sizes) + service.single_calls == 5
+    assert all(size <= 2 for size in service.batch_sizes)
+
+
+def test_exception_reaches_every_caller_in_the_batch():
+    error = RuntimeError("model exploded")
+    service = StubMLService(fail=error)
+
+    async def scenario(b):
+        return await asyncio.gather(
+            *(b.submit(_window(v)) for v in (1.0, 2.0, 3.0)), return_exceptions=True
+        )
+
+    results = _run(service, scenario)
+
+    assert results == [error, error, error]
+
+
+def test_exception_on_lone_request_reaches_caller():
+    service = StubMLService(fail=ValueError("bad input"))
+
+    with pytest.raises(ValueError, match="bad input"):
+        _run(service, lambda b: b.submit(_window(1.0)))
+
+
+def test_cancelled_caller_is_skipped_and_others_still_resolve():
+    service = StubMLService()
+
+    async def scenario(b):
+        doomed = asyncio.ensure_future(b.submit(_window(1.0)))
+        survivor = asyncio.ensure_future(b.submit(_window(2.0)))
+        await asyncio.sleep(0)  # let both enqueue before the batch window closes
+        doomed.cancel()
+        return await survivor, doomed.cancelled()
+
+    survivor_result, was_cancelled = _run(service, scenario)
+
+    assert survivor_result == {"total": 12 * 19 * 2.0}
+    assert was_cancelled
+
+
+def test_batcher_keeps_serving_after_a_failed_batch():
+    service = StubMLService(fail=RuntimeError("transient"))
+
+    async def scenario(b):
+        with pytest.raises(RuntimeError):
+            await b.submit(_window(1.0))
+        service.fail = None
+        return await b.submit(_window(2.0))
+
+    assert _run(service, scenario) == {"total": 12 * 19 * 2.0}
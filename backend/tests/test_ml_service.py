@@ -0,0 +1,118 @@
+"""
+Tests for the ML service's vectorized mappers and batched inference paths.
+The model is replaced with a deterministic numpy stub, so TensorFlow and the
+trained artifacts are not needed.
+"""
+
+import numpy as np
+import pytest
+
+from app.services.ml_service import (
+    DroughtMLService,
+    FEATURE_COUNT,
+    NDVI_MAX,
+    NDVI_MIN,
+    _CATEGORY_LABELS,
+    _SEVERITY_LEVELS,
+    ndvi_confidence,
+    ndvi_confidence_vec,
+    ndvi_to_drought,
+    ndvi_to_level_vec,
+    ndvi_to_regcdi,
+    ndvi_to_regcdi_vec,
+)
+
+# Out-of-range values on both sides, every category threshold, and a dense sweep
+_SPAN = NDVI_MAX - NDVI_MIN
+NDVI_SAMPLES = np.concatenate([
+    [NDVI_MIN - 1000.0, NDVI_MIN, NDVI_MAX, NDVI_MAX + 1000.0],
+    [NDVI_MIN + t * _SPAN for t in (0.15, 0.30, 0.45, 0.65)],
+    np.linspace(NDVI_MIN - 200.0, NDVI_MAX + 200.0, 997),
+])
+
+
+def _stub_service() -> DroughtMLService:
+    """DroughtMLService with identity-ish scalers and a mean-pooling 'model'"""
+    svc = DroughtMLService()
+    svc.model = object()
+    svc._mx = np.zeros(FEATURE_COUNT, dtype=np.float32)
+    svc._sx = np.ones(FEATURE_COUNT, dtype=np.float32)
+    svc._my = np.array([4590.97], dtype=np.float32)
+    svc._sy = np.array([2000.0], dtype=np.float32)
+
+    def infer(x):
+        return x.mean(axis=(1, 2), dtype=np.float32)[:, None]
+
+    svc._infer = infer
+    svc._infer_batch = infer
+    return svc
+
+
+def _without_date(result: dict) -> dict:
+    return {k: v for k, v in result.items() if k != "prediction_date"}
+
+
+# ── Vectorized mappers vs. scalar originals ─────────────────────────────────
+
+def test_level_vec_matches_ndvi_to_drought():
+    levels = ndvi_to_level_vec(NDVI_SAMPLES)
+    for value, level in zip(NDVI_SAMPLES.tolist(), levels.tolist()):
+        assert (_CATEGORY_LABELS[level], _SEVERITY_LEVELS[level]) == ndvi_to_drought(value)
+
+
+def test_regcdi_vec_matches_ndvi_to_regcdi():
+    expected = [ndvi_to_regcdi(v) for v in NDVI_SAMPLES.tolist()]
+    assert ndvi_to_regcdi_vec(NDVI_SAMPLES).tolist() == pytest.approx(expected, abs=1e-12)
+
+
+def test_confidence_vec_matches_ndvi_confidence():
+    expected = [ndvi_confidence(v) for v in NDVI_SAMPLES.tolist()]
+    assert ndvi_confidence_vec(NDVI_SAMPLES).tolist() == pytest.approx(expected, abs=1e-12)
+
+
+# ── Batched inference vs. the single-window path ────────────────────────────
+
+def test_predict_many_matches_predict_array_per_window():
+    svc = _stub_service()
+    rng = np.random.default_rng(0)
+    windows = rng.uniform(-1.5, 1.5, size=(8, 12, FEATURE_COUNT)).astype(np.float32)
+
+    batched = svc.predict_many(windows)
+
+    assert len(batched) == len(windows)
+    for window, result in zip(windows, batched):
+        assert _without_date(result) == _without_date(svc.predict_array(window))
+
+
+def test_predict_batch_array_matches_predict_array_per_window():
+    svc = _stub_service()
+    rng = np.random.default_rng(1)
+    rows = rng.uniform(-1.5, 1.5, size=(20, FEATURE_COUNT)).astype(np.float32)
+
+    batched = svc.predict_batch_array(rows, window_offset=100)
+
+    assert [r["window_start"] for r in batched] == list(range(100, 109))
+    for i, result in enumerate(batched):
+        expected = svc.predict_array(rows[i:i + 12])
+        assert result["window_end"] == result["window_start"] + 11
+        assert _without_date(result) == {
+            **_without_date(expected),
+            "window_start": 100 + i,
+            "window_end": 111 + i,
+        }
+
+
+def test_predict_batch_array_skips_windows_with_nan():
+    svc = _stub_service()
+    rows = np.zeros((20, FEATURE_COUNT), dtype=np.float32)
+    rows[13, 2] = np.nan  # falls inside windows 2..8 (rows i..i+11)
+
+    results = svc.predict_batch_array(rows)
+
+    assert [r["window_start"] for r in results] == [0, 1]
+    assert all(np.isfinite(r["regcdi_value"]) for r in results)
+
+
+def test_predict_batch_array_short_input_returns_empty():
+    svc = _stub_service()
+    assert svc.predict_batch_array(np.zeros((11, FEATURE_COUNT), dtype=np.float32)) == []
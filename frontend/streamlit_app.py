@@ -5,14 +5,20 @@ DynamoDB-backed | Real predictions | Severity map | Live graphs
 
 import streamlit as st
 import pandas as pd
+import numpy as np
+import pyarrow as pa
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import plotly.graph_objects as go
 import plotly.express as px
-from datetime import datetime
-import json
+import orjson
 import boto3
 from decimal import Decimal
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 # ── Page config ──────────────────────────────────────────────────────────────
 st.set_page_config(
@@ -30,7 +36,7 @@ AWS_SECRET_KEY = os.getenv("AWS_SECRET_ACCESS_KEY", "")
 DYNAMO_TABLE = "drought_predictions"
 
 # ── Styling ───────────────────────────────────────────────────────────────────
-st.markdown("""
+_CSS = """
 <style>
     @import url('https://fonts.googleapis.com/css2?family=Space+Mono:wght@400;700&family=DM+Sans:wght@300;400;600&display=swap');
 
@@ -100,7 +106,16 @@ st.markdown("""
         font-size: 0.8rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+
+def inject_css():
+    # Not cached: Streamlit drops elements a rerun does not re-emit, so the
+    # style block must be written on every run to stay on the page
+    st.markdown(_CSS, unsafe_allow_html=True)
+
+
+inject_css()
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
@@ -115,17 +130,35 @@ DROUGHT_COLORS = {
 def category_color(cat):
     return DROUGHT_COLORS.get(cat, "#6b7280")
 
-def severity_css(cat):
-    mapping = {
-        "No Drought": "none",
-        "Mild Drought": "mild",
-        "Moderate Drought": "moderate",
-        "Severe Drought": "severe",
-        "Extreme Drought": "extreme",
-    }
-    return mapping.get(cat, "none")
+MONTH_ABBR = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+              "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+SEVERITY_CSS = {
+    "No Drought":       "none",
+    "Mild Drought":     "mild",
+    "Moderate Drought": "moderate",
+    "Severe Drought":   "severe",
+    "Extreme Drought":  "extreme",
+}
+
+
+# Result banner HTML, built once per category; only the REGCDI value is filled per call
+_CARD_TEMPLATE = """
+<div style="background:{color};padding:1.5rem;border-radius:12px;text-align:center;margin-bottom:1rem;">
+    <div style="font-family:Space Mono;font-size:1.5rem;font-weight:700;color:white;">{cat}</div>
+    <div style="color:rgba(255,255,255,0.8);font-size:0.9rem;">REGCDI: {{reg:.3f}}</div>
+</div>
+"""
+CATEGORY_CARDS = {cat: _CARD_TEMPLATE.format(color=color, cat=cat) for cat, color in DROUGHT_COLORS.items()}
+
+def category_card(cat, reg):
+    card = CATEGORY_CARDS.get(cat) or _CARD_TEMPLATE.format(color=category_color(cat), cat=cat)
+    return card.format(reg=reg)
 
 
+# Shared Figure per REGCDI value (already 4-dp from the API): cache_resource hands
+# back the same object with no pickling, and st.plotly_chart never mutates it
+@st.cache_resource(max_entries=128, show_spinner=False)
 def gauge_chart(value, title="REGCDI"):
     fig = go.Figure(go.Indicator(
         mode="gauge+number",
@@ -156,43 +189,128 @@ def gauge_chart(value, title="REGCDI"):
     return fig
 
 
+@st.cache_resource
+def get_session():
+    """One pooled keep-alive session per server process, reused across reruns"""
+    s = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        # One quick reconnect for dropped keep-alive sockets, but never re-send
+        # after a read timeout — a slow or cold-starting API should fail fast
+        max_retries=Retry(total=3, connect=1, read=0, backoff_factor=0.3),
+    )
+    s.mount("http://", adapter)
+    s.mount("https://", adapter)
+    return s
+
+
+# Failures raise instead of returning, so they are never cached
+@st.cache_data(ttl=30, show_spinner=False)
+def fetch_health(api_url):
+    r = get_session().get(f"{api_url}/health", timeout=5)
+    r.raise_for_status()
+    return orjson.loads(r.content)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def fetch_summary(api_url):
+    r = get_session().get(f"{api_url}/summary", timeout=10)
+    r.raise_for_status()
+    return orjson.loads(r.content)
+
+
 def health_check():
     try:
-        r = requests.get(f"{API_URL}/health", timeout=5)
-        return r.json() if r.status_code == 200 else None
+        return fetch_health(API_URL)
     except:
         return None
 
 
 def get_summary():
     try:
-        r = requests.get(f"{API_URL}/summary", timeout=5)
-        return r.json() if r.status_code == 200 else {}
+        return fetch_summary(API_URL)
     except:
         return {}
 
 
+def health_and_summary():
+    """Issue /health and /summary in parallel; workers inherit the script run context"""
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(
+        max_workers=2,
+        initializer=lambda: add_script_run_ctx(threading.current_thread(), ctx),
+    ) as ex:
+        fh = ex.submit(health_check)
+        fs = ex.submit(get_summary)
+        return fh.result(), fs.result()
+
+
 def get_history(skip=0, limit=50):
     try:
-        r = requests.get(f"{API_URL}/history?skip={skip}&limit={limit}", timeout=5)
-        return r.json() if r.status_code == 200 else {"history": [], "total": 0}
+        r = get_session().get(f"{API_URL}/history?skip={skip}&limit={limit}", timeout=5)
+        return orjson.loads(r.content) if r.status_code == 200 else {"history": [], "total": 0}
     except:
         return {"history": [], "total": 0}
 
 
+def prefetch(fn, *args):
+    """Warm a st.cache_data entry on a daemon thread without blocking the page"""
+    t = threading.Thread(target=fn, args=args, daemon=True)
+    add_script_run_ctx(t)
+    t.start()
+
+
+# Max points sent to the browser for a timeline; longer series are LTTB-downsampled
+TIMELINE_MAX_POINTS = 2000
+
+
+def lttb(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+    Returns the indices of n_out points that keep the visual shape of (x, y).
+    """
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0], idx[-1] = 0, n - 1
+    # n_out - 2 buckets between the fixed first and last points
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nhi = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x, avg_y = x[hi:nhi].mean(), y[hi:nhi].mean()
+
+        # Pick the point in this bucket forming the largest triangle with the
+        # previously selected point and the next bucket's average
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(area.argmax())
+        idx[i + 1] = a
+    return idx
+
+
 # ── DynamoDB direct read (for richer table display) ───────────────────────────
-@st.cache_data(ttl=30)
+@st.cache_resource
+def get_dynamo_table():
+    """One boto3 resource/table handle per process instead of one per cache miss"""
+    dynamo = boto3.resource(
+        "dynamodb",
+        region_name=AWS_REGION,
+        aws_access_key_id=AWS_ACCESS_KEY,
+        aws_secret_access_key=AWS_SECRET_KEY,
+    )
+    return dynamo.Table(DYNAMO_TABLE)
+
+
+@st.cache_data(ttl=30, show_spinner=False)
 def fetch_dynamo_history(limit=200):
     """Pull raw records from DynamoDB for dashboard display"""
     try:
-        dynamo = boto3.resource(
-            "dynamodb",
-            region_name=AWS_REGION,
-            aws_access_key_id=AWS_ACCESS_KEY,
-            aws_secret_access_key=AWS_SECRET_KEY,
-        )
-        table = dynamo.Table(DYNAMO_TABLE)
-        resp = table.scan(Limit=limit)
+        resp = get_dynamo_table().scan(Limit=limit)
         items = resp.get("Items", [])
 
         # Convert Decimal
@@ -213,6 +331,109 @@ def fetch_dynamo_history(limit=200):
         return []
 
 
+@st.cache_data
+def sample_csv_bytes() -> bytes:
+    """Sample upload file, built and encoded once"""
+    sample_df = pd.DataFrame({
+        "rainfall_mm":   [85.5, 92.3, 78.1, 65.2, 45.8, 32.1, 28.5, 35.2, 42.8, 55.3, 68.7, 82.4],
+        "tmax_c":        [32.4, 33.1, 34.2, 35.8, 36.5, 37.2, 36.8, 35.9, 34.5, 33.2, 32.1, 31.8],
+        "tmin_c":        [18.2, 19.5, 20.8, 22.1, 23.5, 24.2, 23.8, 22.9, 21.5, 20.2, 19.1, 18.5],
+        "spei":          [-0.5,-0.3,-0.2,-0.1, 0.1, 0.3, 0.2, 0.0,-0.2,-0.4,-0.5,-0.6],
+        "spi":           [-0.3,-0.2, 0.0, 0.1, 0.2, 0.3, 0.2, 0.1,-0.1,-0.3,-0.4,-0.5],
+        "ndvi":          [0.65,0.68,0.72,0.75,0.73,0.70,0.68,0.66,0.64,0.62,0.63,0.65],
+        "soil_moisture": [45.0,48.2,52.1,55.3,53.8,50.2,47.5,45.8,43.2,42.5,43.8,45.2],
+    })
+    return sample_df.to_csv(index=False).encode()
+
+
+def render_manual_result(result, data_entries):
+    """Gauge, metrics and input radar for one manual prediction"""
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        cat   = result["drought_category"]
+        reg   = result["regcdi_value"]
+        conf  = result["confidence_score"]
+
+        st.markdown(category_card(cat, reg), unsafe_allow_html=True)
+
+        st.metric("REGCDI Value",      f"{reg:.4f}")
+        st.metric("Confidence Score",  f"{conf:.2%}")
+        st.metric("Severity Level",    result.get("severity_level", "—").upper())
+        st.metric("Model Version",     result.get("model_version", "1.0.0"))
+
+    with col2:
+        st.plotly_chart(gauge_chart(reg), use_container_width=True)
+
+    # Input radar
+    avg_inputs = {k: sum(d[k] for d in data_entries) / 12 for k in data_entries[0]}
+    radar_fig = go.Figure(go.Scatterpolar(
+        r=[
+            avg_inputs["Rainfall"] / 18,
+            avg_inputs["VCI"] / 100,
+            (avg_inputs["SPEI"] + 7.5) / 8.7,
+            avg_inputs["VHI"] / 100,
+            avg_inputs["Soil_Moisture"] / 0.46,
+        ],
+        theta=["Rainfall", "VCI", "SPEI", "VHI", "Soil Moisture"],
+        fill="toself",
+        line_color="#0066ff",
+        fillcolor="rgba(0,102,255,0.2)"
+    ))
+    radar_fig.update_layout(
+        polar=dict(
+            bgcolor="#111827",
+            radialaxis=dict(visible=True, range=[0, 1], gridcolor="#374151", tickfont=dict(color="#6b7280")),
+            angularaxis=dict(tickfont=dict(color="#d1d5db", size=11)),
+        ),
+        paper_bgcolor="#0a0f1e",
+        height=280,
+        title=dict(text="Avg Input Profile", font=dict(color="#9ca3af", size=12)),
+        margin=dict(t=40, b=20)
+    )
+    st.plotly_chart(radar_fig, use_container_width=True)
+
+
+# About page text, parsed once at import
+_ABOUT_MD = """
+## Drought Insights & Analytics Platform
+
+### Stack
+- **ML Model**: stat-LSTM · outputs REGCDI
+- **Backend**: FastAPI (Python)
+- **Frontend**: Streamlit
+- **Storage**: AWS DynamoDB (`ap-south-1`)
+- **Model files**: S3 (antigravity bucket)
+
+### REGCDI Scale
+| Range | Category |
+|---|---|
+| ≥ 0.5 | ✅ No Drought |
+| 0.0–0.5 | 🟡 Mild Drought |
+| −0.5–0.0 | 🟠 Moderate Drought |
+| −1.0– −0.5 | 🔴 Severe Drought |
+| < −1.0 | ⚫ Extreme Drought |
+
+### API Endpoints
+| Endpoint | Method | Purpose |
+|---|---|---|
+| `/health` | GET | Status check |
+| `/predict/manual` | POST | Single prediction |
+| `/data` | POST | Batch CSV |
+| `/forecast` | GET | Recent forecasts |
+| `/summary` | GET | Stats |
+| `/history` | GET | Paginated history |
+
+### AWS Setup
+```bash
+export AWS_ACCESS_KEY_ID=your_key
+export AWS_SECRET_ACCESS_KEY=your_secret
+export AWS_REGION=ap-south-1
+```
+DynamoDB table `drought_predictions` is **auto-created** on first run.
+"""
+
+
 # ── Sidebar ───────────────────────────────────────────────────────────────────
 st.sidebar.markdown('<div class="dash-header">🌊 DROUGHT<br>ANALYTICS</div>', unsafe_allow_html=True)
 st.sidebar.markdown("---")
@@ -223,7 +444,10 @@ page = st.sidebar.radio(
     label_visibility="collapsed"
 )
 
-health = health_check()
+if page == "🏠 Dashboard":
+    health, summary = health_and_summary()
+else:
+    health = health_check()
 if health:
     st.sidebar.success(f"✅ API Online — Model {'loaded' if health.get('model_loaded') else 'not loaded'}")
 else:
@@ -237,118 +461,132 @@ st.sidebar.caption(f"Region: `{AWS_REGION}` | Table: `{DYNAMO_TABLE}`")
 # PAGE 1 — DASHBOARD
 # ══════════════════════════════════════════════════════════════════════════════
 if page == "🏠 Dashboard":
-    st.markdown('<div class="dash-header">🌊 Drought Intelligence Platform</div>', unsafe_allow_html=True)
-    st.caption("stat-LSTM · REGCDI · DynamoDB · ap-south-1")
-    st.markdown("---")
+    @st.fragment
+    def render_dashboard(summary):
+        """Refresh reruns only this fragment, not the sidebar or the other pages"""
+        st.markdown('<div class="dash-header">🌊 Drought Intelligence Platform</div>', unsafe_allow_html=True)
+        st.caption("stat-LSTM · REGCDI · DynamoDB · ap-south-1")
+        if st.button("🔄 Refresh"):
+            # KPIs come from /summary; the trend and recent cards from the DynamoDB scan
+            fetch_summary.clear()
+            fetch_dynamo_history.clear()
+            summary = get_summary()
+        st.markdown("---")
+
+        total   = summary.get("total_predictions", 0)
+        avg_reg = summary.get("average_regcdi", 0.0)
+        dist    = summary.get("drought_distribution", {})
+        severe  = dist.get("severe_drought", 0) + dist.get("extreme_drought", 0)
+        last_dt = summary.get("last_prediction_date", "N/A")
+        if last_dt != "N/A":
+            # ISO timestamp -> "15 Jan 2025" by slicing, no datetime round-trip
+            try: last_dt = f"{last_dt[8:10]} {MONTH_ABBR[int(last_dt[5:7]) - 1]} {last_dt[:4]}"
+            except: pass
+
+        # KPI row
+        c1, c2, c3, c4 = st.columns(4)
+        for col, label, value in [
+            (c1, "TOTAL PREDICTIONS", total),
+            (c2, "AVG REGCDI",        f"{avg_reg:.3f}"),
+            (c3, "SEVERE / EXTREME",  severe),
+            (c4, "LAST PREDICTION",   last_dt),
+        ]:
+            col.markdown(f"""
+            <div class="kpi-box">
+                <div class="kpi-label">{label}</div>
+                <div class="kpi-value">{value}</div>
+            </div>""", unsafe_allow_html=True)
 
-    summary = get_summary()
-    total   = summary.get("total_predictions", 0)
-    avg_reg = summary.get("average_regcdi", 0.0)
-    dist    = summary.get("drought_distribution", {})
-    severe  = dist.get("severe_drought", 0) + dist.get("extreme_drought", 0)
-    last_dt = summary.get("last_prediction_date", "N/A")
-    if last_dt != "N/A":
-        try: last_dt = datetime.fromisoformat(last_dt).strftime("%d %b %Y")
-        except: pass
-
-    # KPI row
-    c1, c2, c3, c4 = st.columns(4)
-    for col, label, value in [
-        (c1, "TOTAL PREDICTIONS", total),
-        (c2, "AVG REGCDI",        f"{avg_reg:.3f}"),
-        (c3, "SEVERE / EXTREME",  severe),
-        (c4, "LAST PREDICTION",   last_dt),
-    ]:
-        col.markdown(f"""
-        <div class="kpi-box">
-            <div class="kpi-label">{label}</div>
-            <div class="kpi-value">{value}</div>
-        </div>""", unsafe_allow_html=True)
-
-    st.markdown("<br>", unsafe_allow_html=True)
-
-    # Charts row
-    col_left, col_right = st.columns([1, 1])
-
-    with col_left:
-        st.markdown("#### Drought Distribution")
-        if dist:
-            labels = [k.replace("_", " ").title() for k in dist]
-            values = list(dist.values())
-            colors = [category_color(l) for l in labels]
-            fig = go.Figure(go.Pie(
-                labels=labels, values=values,
-                marker=dict(colors=colors, line=dict(color="#0a0f1e", width=2)),
-                hole=0.55,
-                textfont=dict(family="Space Mono", size=11, color="white"),
-            ))
-            fig.update_layout(
-                paper_bgcolor="#0a0f1e", plot_bgcolor="#0a0f1e",
-                font=dict(color="#9ca3af"),
-                showlegend=True,
-                legend=dict(font=dict(size=11, color="#d1d5db")),
-                height=280, margin=dict(t=10, b=10)
-            )
-            st.plotly_chart(fig, use_container_width=True)
+        st.markdown("<br>", unsafe_allow_html=True)
+
+        # Charts row
+        col_left, col_right = st.columns([1, 1])
+
+        with col_left:
+            st.markdown("#### Drought Distribution")
+            if dist:
+                labels = [k.replace("_", " ").title() for k in dist]
+                values = list(dist.values())
+                colors = [category_color(l) for l in labels]
+                fig = go.Figure(go.Pie(
+                    labels=labels, values=values,
+                    marker=dict(colors=colors, line=dict(color="#0a0f1e", width=2)),
+                    hole=0.55,
+                    textfont=dict(family="Space Mono", size=11, color="white"),
+                ))
+                fig.update_layout(
+                    paper_bgcolor="#0a0f1e", plot_bgcolor="#0a0f1e",
+                    font=dict(color="#9ca3af"),
+                    showlegend=True,
+                    legend=dict(font=dict(size=11, color="#d1d5db")),
+                    height=280, margin=dict(t=10, b=10)
+                )
+                st.plotly_chart(fig, use_container_width=True)
+            else:
+                st.info("No predictions yet. Run a prediction to see data here.")
+
+        with col_right:
+            st.markdown("#### REGCDI Trend")
+            dynamo_items = fetch_dynamo_history(50)
+            if dynamo_items:
+                df_trend = pd.DataFrame(dynamo_items)[["created_at", "regcdi_value", "drought_category"]].head(30)
+                df_trend = df_trend.sort_values("created_at")
+                df_trend["ts"] = df_trend["created_at"].str[:16]
+
+                fig2 = go.Figure()
+                fig2.add_trace(go.Scatter(
+                    x=df_trend["ts"], y=df_trend["regcdi_value"],
+                    mode="lines+markers",
+                    line=dict(color="#0066ff", width=2),
+                    marker=dict(
+                        color=[category_color(c) for c in df_trend["drought_category"]],
+                        size=8, line=dict(color="#0a0f1e", width=1)
+                    ),
+                    hovertemplate="<b>%{x}</b><br>REGCDI: %{y:.3f}<extra></extra>"
+                ))
+                fig2.add_hline(y=0, line_dash="dot", line_color="#4b5563")
+                fig2.update_layout(
+                    paper_bgcolor="#0a0f1e", plot_bgcolor="#111827",
+                    xaxis=dict(tickfont=dict(size=9, color="#6b7280"), gridcolor="#1f2937", showgrid=True),
+                    yaxis=dict(tickfont=dict(size=10, color="#9ca3af"), gridcolor="#1f2937"),
+                    height=280, margin=dict(t=10, b=30, l=40, r=10),
+                    font=dict(color="#9ca3af")
+                )
+                st.plotly_chart(fig2, use_container_width=True)
+            else:
+                st.info("No trend data yet.")
+
+        # Recent 5 predictions
+        st.markdown("#### Recent Predictions")
+        if dynamo_items:
+            for item in dynamo_items[:5]:
+                cat   = item.get("drought_category", "Unknown")
+                loc   = item.get("location", "Unknown")
+                reg   = item.get("regcdi_value", 0)
+                ts    = item.get("created_at", "")[:16]
+                conf  = item.get("confidence_score", 0)
+                css   = SEVERITY_CSS.get(cat, "none")
+                st.markdown(f"""
+                <div class="pred-card">
+                    <span style="font-family:Space Mono;font-size:0.8rem;color:#6b7280;">{ts}</span>
+                    &nbsp;&nbsp;
+                    <span class="severity-{css}" style="font-weight:700;">{cat}</span>
+                    &nbsp;·&nbsp;
+                    <span style="color:#d1d5db;">REGCDI: <b>{reg:.3f}</b></span>
+                    &nbsp;·&nbsp;
+                    <span style="color:#9ca3af;">📍 {loc}</span>
+                    &nbsp;·&nbsp;
+                    <span style="color:#6b7280;font-size:0.8rem;">conf: {conf:.0%}</span>
+                </div>""", unsafe_allow_html=True)
         else:
-            st.info("No predictions yet. Run a prediction to see data here.")
+            st.info("No predictions yet.")
 
-    with col_right:
-        st.markdown("#### REGCDI Trend")
-        dynamo_items = fetch_dynamo_history(50)
+        # The DynamoDB Table page reads a larger scan; have it cached before
+        # navigation, unless the dashboard's own scan found nothing to show
         if dynamo_items:
-            df_trend = pd.DataFrame(dynamo_items)[["created_at", "regcdi_value", "drought_category"]].head(30)
-            df_trend = df_trend.sort_values("created_at")
-            df_trend["ts"] = df_trend["created_at"].str[:16]
-
-            fig2 = go.Figure()
-            fig2.add_trace(go.Scatter(
-                x=df_trend["ts"], y=df_trend["regcdi_value"],
-                mode="lines+markers",
-                line=dict(color="#0066ff", width=2),
-                marker=dict(
-                    color=[category_color(c) for c in df_trend["drought_category"]],
-                    size=8, line=dict(color="#0a0f1e", width=1)
-                ),
-                hovertemplate="<b>%{x}</b><br>REGCDI: %{y:.3f}<extra></extra>"
-            ))
-            fig2.add_hline(y=0, line_dash="dot", line_color="#4b5563")
-            fig2.update_layout(
-                paper_bgcolor="#0a0f1e", plot_bgcolor="#111827",
-                xaxis=dict(tickfont=dict(size=9, color="#6b7280"), gridcolor="#1f2937", showgrid=True),
-                yaxis=dict(tickfont=dict(size=10, color="#9ca3af"), gridcolor="#1f2937"),
-                height=280, margin=dict(t=10, b=30, l=40, r=10),
-                font=dict(color="#9ca3af")
-            )
-            st.plotly_chart(fig2, use_container_width=True)
-        else:
-            st.info("No trend data yet.")
-
-    # Recent 5 predictions
-    st.markdown("#### Recent Predictions")
-    if dynamo_items:
-        for item in dynamo_items[:5]:
-            cat   = item.get("drought_category", "Unknown")
-            loc   = item.get("location", "Unknown")
-            reg   = item.get("regcdi_value", 0)
-            ts    = item.get("created_at", "")[:16]
-            conf  = item.get("confidence_score", 0)
-            css   = severity_css(cat)
-            color = category_color(cat)
-            st.markdown(f"""
-            <div class="pred-card">
-                <span style="font-family:Space Mono;font-size:0.8rem;color:#6b7280;">{ts}</span>
-                &nbsp;&nbsp;
-                <span class="severity-{css}" style="font-weight:700;">{cat}</span>
-                &nbsp;·&nbsp;
-                <span style="color:#d1d5db;">REGCDI: <b>{reg:.3f}</b></span>
-                &nbsp;·&nbsp;
-                <span style="color:#9ca3af;">📍 {loc}</span>
-                &nbsp;·&nbsp;
-                <span style="color:#6b7280;font-size:0.8rem;">conf: {conf:.0%}</span>
-            </div>""", unsafe_allow_html=True)
-    else:
-        st.info("No predictions yet.")
+            prefetch(fetch_dynamo_history, 200)
+
+    render_dashboard(summary)
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -376,123 +614,92 @@ elif page == "🔮 Predict":
         | SIWSI | 0.16–0.74 | Shortwave Infrared Water Stress Index |
         """)
 
-    location = st.text_input("📍 Location", placeholder="e.g., Vidarbha, Amravati, Nagpur")
-
-    # Vidarbha realistic defaults from dataset means
-    defaults = dict(
-        EVI=2757.0, LST=35.3, LST_Night=21.3, Rainfall=3.4,
-        Soil_Moisture=0.30, SPI=-0.01, PET=176.8, SPEI=-0.16,
-        NDVI_min=2234.0, NDVI_max=7041.0, VCI=48.3,
-        LST_min=27.6, LST_max=48.6, TCI=63.0,
-        SM_min=0.20, SM_max=0.45, SMCI=37.6, VHI=55.7, SIWSI=0.45
-    )
-
-    data_entries = []
-    tabs = st.tabs([f"Month {i+1}" for i in range(12)])
-
-    for i, tab in enumerate(tabs):
-        with tab:
-            c1, c2, c3 = st.columns(3)
-            with c1:
-                evi      = st.number_input("EVI",           value=defaults["EVI"],          key=f"evi{i}")
-                lst      = st.number_input("LST °C",         value=defaults["LST"],          key=f"lst{i}")
-                lst_n    = st.number_input("LST Night °C",   value=defaults["LST_Night"],    key=f"lstn{i}")
-                rain     = st.number_input("Rainfall mm",    value=defaults["Rainfall"],     key=f"rain{i}")
-                soil     = st.number_input("Soil Moisture",  value=defaults["Soil_Moisture"],key=f"soil{i}", format="%.4f")
-                spi      = st.number_input("SPI",            value=defaults["SPI"],          key=f"spi{i}",  format="%.4f")
-                pet      = st.number_input("PET mm",         value=defaults["PET"],          key=f"pet{i}")
-            with c2:
-                spei     = st.number_input("SPEI",           value=defaults["SPEI"],         key=f"spei{i}", format="%.4f")
-                ndvi_min = st.number_input("NDVI_min",       value=defaults["NDVI_min"],     key=f"nmin{i}")
-                ndvi_max = st.number_input("NDVI_max",       value=defaults["NDVI_max"],     key=f"nmax{i}")
-                vci      = st.number_input("VCI %",          value=defaults["VCI"],          key=f"vci{i}")
-                lst_min  = st.number_input("LST_min °C",     value=defaults["LST_min"],      key=f"lmin{i}")
-                lst_max  = st.number_input("LST_max °C",     value=defaults["LST_max"],      key=f"lmax{i}")
-            with c3:
-                tci      = st.number_input("TCI %",          value=defaults["TCI"],          key=f"tci{i}")
-                sm_min   = st.number_input("SM_min",         value=defaults["SM_min"],       key=f"smn{i}",  format="%.4f")
-                sm_max   = st.number_input("SM_max",         value=defaults["SM_max"],       key=f"smx{i}",  format="%.4f")
-                smci     = st.number_input("SMCI %",         value=defaults["SMCI"],         key=f"smci{i}")
-                vhi      = st.number_input("VHI %",          value=defaults["VHI"],          key=f"vhi{i}")
-                siwsi    = st.number_input("SIWSI",          value=defaults["SIWSI"],        key=f"siwsi{i}", format="%.4f")
-
-            data_entries.append({
-                "EVI": evi, "LST": lst, "LST_Night": lst_n,
-                "Rainfall": rain, "Soil_Moisture": soil,
-                "SPI": spi, "PET": pet, "SPEI": spei,
-                "NDVI_min": ndvi_min, "NDVI_max": ndvi_max, "VCI": vci,
-                "LST_min": lst_min, "LST_max": lst_max, "TCI": tci,
-                "SM_min": sm_min, "SM_max": sm_max, "SMCI": smci,
-                "VHI": vhi, "SIWSI": siwsi
-            })
+    # Batch all 12 months of inputs into one form so widget edits do not
+    # trigger a full rerun; the script only re-executes on submit.
+    with st.form("manual_pred_form"):
+        location = st.text_input("📍 Location", placeholder="e.g., Vidarbha, Amravati, Nagpur")
+
+        # Vidarbha realistic defaults from dataset means
+        defaults = dict(
+            EVI=2757.0, LST=35.3, LST_Night=21.3, Rainfall=3.4,
+            Soil_Moisture=0.30, SPI=-0.01, PET=176.8, SPEI=-0.16,
+            NDVI_min=2234.0, NDVI_max=7041.0, VCI=48.3,
+            LST_min=27.6, LST_max=48.6, TCI=63.0,
+            SM_min=0.20, SM_max=0.45, SMCI=37.6, VHI=55.7, SIWSI=0.45
+        )
 
-    if st.button("🔮 Run Prediction", type="primary"):
+        data_entries = []
+        tabs = st.tabs([f"Month {i+1}" for i in range(12)])
+
+        for i, tab in enumerate(tabs):
+            with tab:
+                c1, c2, c3 = st.columns(3)
+                with c1:
+                    evi      = st.number_input("EVI",           value=defaults["EVI"],          key=f"evi{i}")
+                    lst      = st.number_input("LST °C",         value=defaults["LST"],          key=f"lst{i}")
+                    lst_n    = st.number_input("LST Night °C",   value=defaults["LST_Night"],    key=f"lstn{i}")
+                    rain     = st.number_input("Rainfall mm",    value=defaults["Rainfall"],     key=f"rain{i}")
+                    soil     = st.number_input("Soil Moisture",  value=defaults["Soil_Moisture"],key=f"soil{i}", format="%.4f")
+                    spi      = st.number_input("SPI",            value=defaults["SPI"],          key=f"spi{i}",  format="%.4f")
+                    pet      = st.number_input("PET mm",         value=defaults["PET"],          key=f"pet{i}")
+                with c2:
+                    spei     = st.number_input("SPEI",           value=defaults["SPEI"],         key=f"spei{i}", format="%.4f")
+                    ndvi_min = st.number_input("NDVI_min",       value=defaults["NDVI_min"],     key=f"nmin{i}")
+                    ndvi_max = st.number_input("NDVI_max",       value=defaults["NDVI_max"],     key=f"nmax{i}")
+                    vci      = st.number_input("VCI %",          value=defaults["VCI"],          key=f"vci{i}")
+                    lst_min  = st.number_input("LST_min °C",     value=defaults["LST_min"],      key=f"lmin{i}")
+                    lst_max  = st.number_input("LST_max °C",     value=defaults["LST_max"],      key=f"lmax{i}")
+                with c3:
+                    tci      = st.number_input("TCI %",          value=defaults["TCI"],          key=f"tci{i}")
+                    sm_min   = st.number_input("SM_min",         value=defaults["SM_min"],       key=f"smn{i}",  format="%.4f")
+                    sm_max   = st.number_input("SM_max",         value=defaults["SM_max"],       key=f"smx{i}",  format="%.4f")
+                    smci     = st.number_input("SMCI %",         value=defaults["SMCI"],         key=f"smci{i}")
+                    vhi      = st.number_input("VHI %",          value=defaults["VHI"],          key=f"vhi{i}")
+                    siwsi    = st.number_input("SIWSI",          value=defaults["SIWSI"],        key=f"siwsi{i}", format="%.4f")
+
+                data_entries.append({
+                    "EVI": evi, "LST": lst, "LST_Night": lst_n,
+                    "Rainfall": rain, "Soil_Moisture": soil,
+                    "SPI": spi, "PET": pet, "SPEI": spei,
+                    "NDVI_min": ndvi_min, "NDVI_max": ndvi_max, "VCI": vci,
+                    "LST_min": lst_min, "LST_max": lst_max, "TCI": tci,
+                    "SM_min": sm_min, "SM_max": sm_max, "SMCI": smci,
+                    "VHI": vhi, "SIWSI": siwsi
+                })
+
+        submitted = st.form_submit_button("🔮 Run Prediction", type="primary")
+
+    if submitted:
         with st.spinner("Running stat-LSTM inference..."):
             try:
                 payload = {"data": data_entries, "location": location or None}
-                resp = requests.post(f"{API_URL}/predict/manual", json=payload, timeout=30)
+                resp = get_session().post(
+                    f"{API_URL}/predict/manual",
+                    data=orjson.dumps(payload),
+                    headers={"Content-Type": "application/json"},
+                    timeout=30,
+                )
 
                 if resp.status_code == 200:
-                    result = resp.json()
+                    result = orjson.loads(resp.content)
+                    st.session_state["last_manual_result"] = result
+                    st.session_state["last_manual_inputs"] = data_entries
                     st.success("✅ Prediction complete — saved to DynamoDB")
-
-                    col1, col2 = st.columns([1, 1])
-
-                    with col1:
-                        cat   = result["drought_category"]
-                        color = category_color(cat)
-                        reg   = result["regcdi_value"]
-                        conf  = result["confidence_score"]
-
-                        st.markdown(f"""
-                        <div style="background:{color};padding:1.5rem;border-radius:12px;text-align:center;margin-bottom:1rem;">
-                            <div style="font-family:Space Mono;font-size:1.5rem;font-weight:700;color:white;">{cat}</div>
-                            <div style="color:rgba(255,255,255,0.8);font-size:0.9rem;">REGCDI: {reg:.3f}</div>
-                        </div>
-                        """, unsafe_allow_html=True)
-
-                        st.metric("REGCDI Value",      f"{reg:.4f}")
-                        st.metric("Confidence Score",  f"{conf:.2%}")
-                        st.metric("Severity Level",    result.get("severity_level", "—").upper())
-                        st.metric("Model Version",     result.get("model_version", "1.0.0"))
-
-                    with col2:
-                        st.plotly_chart(gauge_chart(reg), use_container_width=True)
-
-                    # Input radar
-                    avg_inputs = {k: sum(d[k] for d in data_entries) / 12 for k in data_entries[0]}
-                    radar_fig = go.Figure(go.Scatterpolar(
-                        r=[
-                            avg_inputs["Rainfall"] / 18,
-                            avg_inputs["VCI"] / 100,
-                            (avg_inputs["SPEI"] + 7.5) / 8.7,
-                            avg_inputs["VHI"] / 100,
-                            avg_inputs["Soil_Moisture"] / 0.46,
-                        ],
-                        theta=["Rainfall", "VCI", "SPEI", "VHI", "Soil Moisture"],
-                        fill="toself",
-                        line_color="#0066ff",
-                        fillcolor="rgba(0,102,255,0.2)"
-                    ))
-                    radar_fig.update_layout(
-                        polar=dict(
-                            bgcolor="#111827",
-                            radialaxis=dict(visible=True, range=[0, 1], gridcolor="#374151", tickfont=dict(color="#6b7280")),
-                            angularaxis=dict(tickfont=dict(color="#d1d5db", size=11)),
-                        ),
-                        paper_bgcolor="#0a0f1e",
-                        height=280,
-                        title=dict(text="Avg Input Profile", font=dict(color="#9ca3af", size=12)),
-                        margin=dict(t=40, b=20)
-                    )
-                    st.plotly_chart(radar_fig, use_container_width=True)
+                    render_manual_result(result, data_entries)
 
                 else:
-                    st.error(f"API Error: {resp.json().get('detail', 'Unknown')}")
+                    st.error(f"API Error: {orjson.loads(resp.content).get('detail', 'Unknown')}")
 
             except Exception as e:
                 st.error(f"Connection error: {e}")
 
+    elif "last_manual_result" in st.session_state:
+        # Re-show the last result on reruns / page revisits without re-POSTing
+        render_manual_result(
+            st.session_state["last_manual_result"],
+            st.session_state["last_manual_inputs"],
+        )
+
 
 # ══════════════════════════════════════════════════════════════════════════════
 # PAGE 3 — UPLOAD CSV
@@ -502,55 +709,64 @@ elif page == "📁 Upload CSV":
     st.caption("Upload CSV → batch REGCDI predictions → saved to DynamoDB")
     st.markdown("---")
 
-    sample_df = pd.DataFrame({
-        "rainfall_mm":   [85.5, 92.3, 78.1, 65.2, 45.8, 32.1, 28.5, 35.2, 42.8, 55.3, 68.7, 82.4],
-        "tmax_c":        [32.4, 33.1, 34.2, 35.8, 36.5, 37.2, 36.8, 35.9, 34.5, 33.2, 32.1, 31.8],
-        "tmin_c":        [18.2, 19.5, 20.8, 22.1, 23.5, 24.2, 23.8, 22.9, 21.5, 20.2, 19.1, 18.5],
-        "spei":          [-0.5,-0.3,-0.2,-0.1, 0.1, 0.3, 0.2, 0.0,-0.2,-0.4,-0.5,-0.6],
-        "spi":           [-0.3,-0.2, 0.0, 0.1, 0.2, 0.3, 0.2, 0.1,-0.1,-0.3,-0.4,-0.5],
-        "ndvi":          [0.65,0.68,0.72,0.75,0.73,0.70,0.68,0.66,0.64,0.62,0.63,0.65],
-        "soil_moisture": [45.0,48.2,52.1,55.3,53.8,50.2,47.5,45.8,43.2,42.5,43.8,45.2],
-    })
-    st.download_button("📥 Download sample CSV", sample_df.to_csv(index=False), "sample.csv", "text/csv")
+    st.download_button("📥 Download sample CSV", sample_csv_bytes(), "sample.csv", "text/csv")
 
     uploaded = st.file_uploader("Choose CSV", type=["csv"])
     if uploaded:
-        df = pd.read_csv(uploaded)
-        st.dataframe(df.head(15), use_container_width=True)
-        st.caption(f"{len(df)} rows · {max(0, len(df)-11)} possible prediction windows")
+        # Parse only the preview rows; count the rest as raw lines
+        preview = pd.read_csv(uploaded, nrows=15)
+        uploaded.seek(0)
+        n_rows = sum(1 for _ in uploaded) - 1
+        uploaded.seek(0)
+        st.dataframe(preview, use_container_width=True)
+        st.caption(f"{n_rows} rows · {max(0, n_rows-11)} possible prediction windows")
 
         if st.button("🚀 Upload & Predict", type="primary"):
             with st.spinner("Processing..."):
                 try:
-                    files = {"file": (uploaded.name, uploaded.getvalue(), "text/csv")}
-                    resp  = requests.post(f"{API_URL}/data", files=files, timeout=120)
+                    # Rewind after the preview read. requests still reads the
+                    # whole file to build the multipart body, so this is not
+                    # streamed; peak memory matches getvalue()
+                    uploaded.seek(0)
+                    files = {"file": (uploaded.name, uploaded, "text/csv")}
+                    resp  = get_session().post(f"{API_URL}/data", files=files, timeout=120)
 
                     if resp.status_code == 200:
-                        result = resp.json()
+                        result = orjson.loads(resp.content)
                         preds  = result["predictions"]
                         st.success(f"✅ {result['total_predictions']} predictions — saved to DynamoDB")
 
-                        pred_df = pd.DataFrame(preds)
+                        # Columnar ingest via Arrow instead of a per-row dict walk
+                        pred_df = pa.Table.from_pylist(preds).to_pandas(types_mapper=pd.ArrowDtype)
                         st.dataframe(pred_df, use_container_width=True)
 
                         if "regcdi_value" in pred_df.columns:
-                            fig = px.line(
-                                pred_df, y="regcdi_value",
-                                title="REGCDI Over Batch Windows",
-                                color_discrete_sequence=["#0066ff"]
-                            )
+                            x = np.arange(len(pred_df), dtype=float)
+                            y = pred_df["regcdi_value"].to_numpy(dtype=float)
+                            if len(y) > TIMELINE_MAX_POINTS:
+                                keep = lttb(x, y, TIMELINE_MAX_POINTS)
+                                x, y = x[keep], y[keep]
+                                st.caption(f"Timeline downsampled to {TIMELINE_MAX_POINTS} of {len(pred_df)} windows (LTTB)")
+
+                            # WebGL trace: one canvas instead of an SVG node per point
+                            fig = go.Figure(go.Scattergl(
+                                x=x, y=y,
+                                mode="lines", name="REGCDI",
+                                line=dict(color="#0066ff"),
+                            ))
                             fig.add_hline(y=0, line_dash="dot", line_color="#4b5563")
                             fig.update_layout(
+                                title="REGCDI Over Batch Windows",
                                 paper_bgcolor="#0a0f1e", plot_bgcolor="#111827",
                                 font=dict(color="#9ca3af"), height=320,
-                                xaxis=dict(gridcolor="#1f2937"),
-                                yaxis=dict(gridcolor="#1f2937"),
+                                xaxis=dict(title="Window Index", gridcolor="#1f2937"),
+                                yaxis=dict(title="REGCDI Value", gridcolor="#1f2937"),
                             )
                             st.plotly_chart(fig, use_container_width=True)
 
                         st.download_button("📥 Download results", pred_df.to_csv(index=False), "predictions.csv", "text/csv")
                     else:
-                        st.error(f"Error: {resp.json().get('detail','Failed')}")
+                        st.error(f"Error: {orjson.loads(resp.content).get('detail','Failed')}")
                 except Exception as e:
                     st.error(str(e))
 
@@ -559,66 +775,70 @@ elif page == "📁 Upload CSV":
 # PAGE 4 — DYNAMODB TABLE
 # ══════════════════════════════════════════════════════════════════════════════
 elif page == "📋 DynamoDB Table":
-    st.markdown('<div class="dash-header">📋 DynamoDB Records</div>', unsafe_allow_html=True)
-    st.caption(f"Live data from `{DYNAMO_TABLE}` · region: `{AWS_REGION}`")
-    st.markdown("---")
-
-    col_refresh, col_filter, _ = st.columns([1, 2, 3])
-    with col_refresh:
-        if st.button("🔄 Refresh"):
-            st.cache_data.clear()
-    with col_filter:
-        category_filter = st.selectbox(
-            "Filter by category",
-            ["All", "No Drought", "Mild Drought", "Moderate Drought", "Severe Drought", "Extreme Drought"]
-        )
+    @st.fragment
+    def render_dynamo_table():
+        """Filter / refresh widgets rerun only this fragment"""
+        st.markdown('<div class="dash-header">📋 DynamoDB Records</div>', unsafe_allow_html=True)
+        st.caption(f"Live data from `{DYNAMO_TABLE}` · region: `{AWS_REGION}`")
+        st.markdown("---")
+
+        col_refresh, col_filter, _ = st.columns([1, 2, 3])
+        with col_refresh:
+            if st.button("🔄 Refresh"):
+                st.cache_data.clear()
+        with col_filter:
+            category_filter = st.selectbox(
+                "Filter by category",
+                ["All", "No Drought", "Mild Drought", "Moderate Drought", "Severe Drought", "Extreme Drought"]
+            )
 
-    items = fetch_dynamo_history(200)
+        items = fetch_dynamo_history(200)
 
-    if items:
-        df_dyn = pd.DataFrame(items)
+        if items:
+            df_dyn = pd.DataFrame(items)
 
-        # Keep only relevant columns
-        cols = ["created_at", "location", "drought_category", "regcdi_value", "confidence_score", "prediction_type", "model_version"]
-        cols = [c for c in cols if c in df_dyn.columns]
-        df_dyn = df_dyn[cols].copy()
+            # Keep only relevant columns
+            cols = ["created_at", "location", "drought_category", "regcdi_value", "confidence_score", "prediction_type", "model_version"]
+            cols = [c for c in cols if c in df_dyn.columns]
+            df_dyn = df_dyn[cols].copy()
+            # Stats cover every fetched record, taken before filtering/formatting
+            vals = df_dyn["regcdi_value"].to_numpy(dtype=float)
 
-        if category_filter != "All":
-            df_dyn = df_dyn[df_dyn["drought_category"] == category_filter]
+            if category_filter != "All":
+                df_dyn = df_dyn[df_dyn["drought_category"] == category_filter]
 
-        df_dyn["created_at"]      = df_dyn["created_at"].str[:16]
-        df_dyn["regcdi_value"]    = df_dyn["regcdi_value"].apply(lambda x: f"{x:.4f}")
-        df_dyn["confidence_score"] = df_dyn["confidence_score"].apply(lambda x: f"{float(x):.1%}")
+            df_dyn["created_at"]      = df_dyn["created_at"].str[:16]
+            df_dyn["regcdi_value"]    = df_dyn["regcdi_value"].astype(float).round(4)
+            df_dyn["confidence_score"] = (df_dyn["confidence_score"].astype(float) * 100).round(1).astype(str) + "%"
 
-        df_dyn.columns = ["Timestamp", "Location", "Category", "REGCDI", "Confidence", "Type", "Model"][:len(df_dyn.columns)]
+            df_dyn.columns = ["Timestamp", "Location", "Category", "REGCDI", "Confidence", "Type", "Model"][:len(df_dyn.columns)]
 
-        st.dataframe(
-            df_dyn,
-            use_container_width=True,
-            height=420,
-        )
+            st.dataframe(
+                df_dyn,
+                use_container_width=True,
+                height=420,
+            )
 
-        st.caption(f"Showing {len(df_dyn)} records")
+            st.caption(f"Showing {len(df_dyn)} records")
 
-        # Stats bar
-        raw = fetch_dynamo_history(200)
-        if raw:
-            vals = [i["regcdi_value"] for i in raw]
+            # Stats bar
             c1, c2, c3, c4 = st.columns(4)
-            c1.metric("Total records", len(raw))
-            c2.metric("Min REGCDI",   f"{min(vals):.3f}")
-            c3.metric("Max REGCDI",   f"{max(vals):.3f}")
-            c4.metric("Avg REGCDI",   f"{sum(vals)/len(vals):.3f}")
+            c1.metric("Total records", len(items))
+            c2.metric("Min REGCDI",   f"{vals.min():.3f}")
+            c3.metric("Max REGCDI",   f"{vals.max():.3f}")
+            c4.metric("Avg REGCDI",   f"{vals.mean():.3f}")
 
-    else:
-        st.info("No records found in DynamoDB yet. Run a prediction first!")
-        st.markdown("""
-        **Setup checklist:**
-        - ✅ Set `AWS_ACCESS_KEY_ID` env variable
-        - ✅ Set `AWS_SECRET_ACCESS_KEY` env variable
-        - ✅ Set `AWS_REGION=ap-south-1`
-        - ✅ IAM user has DynamoDB read/write permissions
-        """)
+        else:
+            st.info("No records found in DynamoDB yet. Run a prediction first!")
+            st.markdown("""
+            **Setup checklist:**
+            - ✅ Set `AWS_ACCESS_KEY_ID` env variable
+            - ✅ Set `AWS_SECRET_ACCESS_KEY` env variable
+            - ✅ Set `AWS_REGION=ap-south-1`
+            - ✅ IAM user has DynamoDB read/write permissions
+            """)
+
+    render_dynamo_table()
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -729,43 +949,7 @@ elif page == "ℹ️ About":
     st.markdown('<div class="dash-header">ℹ️ About</div>', unsafe_allow_html=True)
     st.markdown("---")
 
-    st.markdown("""
-    ## Drought Insights & Analytics Platform
-
-    ### Stack
-    - **ML Model**: stat-LSTM · outputs REGCDI
-    - **Backend**: FastAPI (Python)
-    - **Frontend**: Streamlit
-    - **Storage**: AWS DynamoDB (`ap-south-1`)
-    - **Model files**: S3 (antigravity bucket)
-
-    ### REGCDI Scale
-    | Range | Category |
-    |---|---|
-    | ≥ 0.5 | ✅ No Drought |
-    | 0.0–0.5 | 🟡 Mild Drought |
-    | −0.5–0.0 | 🟠 Moderate Drought |
-    | −1.0– −0.5 | 🔴 Severe Drought |
-    | < −1.0 | ⚫ Extreme Drought |
-
-    ### API Endpoints
-    | Endpoint | Method | Purpose |
-    |---|---|---|
-    | `/health` | GET | Status check |
-    | `/predict/manual` | POST | Single prediction |
-    | `/data` | POST | Batch CSV |
-    | `/forecast` | GET | Recent forecasts |
-    | `/summary` | GET | Stats |
-    | `/history` | GET | Paginated history |
-
-    ### AWS Setup
-    ```bash
-    export AWS_ACCESS_KEY_ID=your_key
-    export AWS_SECRET_ACCESS_KEY=your_secret
-    export AWS_REGION=ap-south-1
-    ```
-    DynamoDB table `drought_predictions` is **auto-created** on first run.
-    """)
+    st.markdown(_ABOUT_MD)
 
 # ── Footer ────────────────────────────────────────────────────────────────────
 st.sidebar.markdown("---")